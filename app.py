@@ -1,14 +1,24 @@
 import streamlit as st
 import requests
-import json
+from http.cookiejar import DefaultCookiePolicy
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import orjson
 from datetime import datetime, timedelta
-from collections import Counter, defaultdict
+import os
 import re
+import sqlite3
+import threading
 import time
-from textblob import TextBlob
+from contextlib import closing
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
+
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
 
 # Configure page
 st.set_page_config(
@@ -19,130 +29,352 @@ st.set_page_config(
 
 # Initialize session state
 if 'commits_data' not in st.session_state:
-    st.session_state.commits_data = []
+    st.session_state.commits_data = None
 if 'team_analysis' not in st.session_state:
     st.session_state.team_analysis = {}
-def make_api_request(url, headers, params=None, timeout=30):
-    """Make API request with error handling"""
+if 'team_totals' not in st.session_state:
+    st.session_state.team_totals = {}
+
+# Upper bound on projects whose commits are fetched at the same time
+MAX_CONCURRENT_REQUESTS = 16
+# Upper bound on API requests started per second, shared by all fetch workers
+MAX_REQUESTS_PER_SECOND = 10
+# Seconds fetched commits and their analysis are reused across reruns
+CACHE_TTL = 600
+# Columns kept for every commit; the raw GitLab payloads are dropped once parsed
+COMMIT_COLUMNS = ['author', 'project', 'created_at', 'title']
+# On-disk store of validators and trimmed bodies for pages requested conditionally;
+# kept next to this script unless GITLAB_PAGE_CACHE_PATH points elsewhere
+PAGE_CACHE_PATH = os.environ.get(
+    "GITLAB_PAGE_CACHE_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".gitlab_page_cache.sqlite")
+)
+# Cached pages older than this (seconds), or beyond the newest rows, are pruned
+PAGE_CACHE_MAX_AGE = 7 * 24 * 3600
+PAGE_CACHE_MAX_ROWS = 5000
+# The only commit fields written to the page cache; emails and full messages are not kept
+COMMIT_CACHE_FIELDS = ('author_name', 'created_at', 'title')
+
+# Earliest time the next API request may start; guarded by the lock below
+_next_request_at = 0.0
+_rate_limit_lock = threading.Lock()
+
+def wait_for_rate_limit():
+    """Block until the next API request fits under MAX_REQUESTS_PER_SECOND"""
+    global _next_request_at
+    with _rate_limit_lock:
+        now = time.monotonic()
+        start_at = max(now, _next_request_at)
+        _next_request_at = start_at + 1 / MAX_REQUESTS_PER_SECOND
+    time.sleep(start_at - now)
+
+@st.cache_resource(show_spinner=False)
+def get_http_session():
+    """Shared HTTP session so pooled connections and TLS handshakes are reused"""
+    session = requests.Session()
+    # The session is shared by every user and auth is a header token, so keep no cookies
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    # Transient errors and rate limiting (honouring Retry-After) are retried with backoff
+    retries = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        raise_on_status=False
+    )
+    # Several users may fetch at once; wait for a free connection rather than discard one
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retries, pool_block=True)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+# Resolved in the script thread; worker threads share the same session
+HTTP_SESSION = get_http_session()
+
+def open_page_cache():
+    """Open a connection to the page cache database"""
+    return sqlite3.connect(PAGE_CACHE_PATH, timeout=30)
+
+@st.cache_resource(show_spinner=False)
+def init_page_cache():
+    """Create the page cache table once per process (raises, and is retried, on failure)"""
+    with closing(open_page_cache()) as conn, conn:
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS commit_pages (url TEXT PRIMARY KEY, etag TEXT, "
+            "last_modified TEXT, link TEXT, body BLOB, fetched_at REAL)"
+        )
+
+def prune_page_cache():
+    """Drop cached pages past PAGE_CACHE_MAX_AGE and all but the newest PAGE_CACHE_MAX_ROWS"""
+    with closing(open_page_cache()) as conn, conn:
+        conn.execute(
+            "DELETE FROM commit_pages WHERE fetched_at < ?", (time.time() - PAGE_CACHE_MAX_AGE,)
+        )
+        conn.execute(
+            "DELETE FROM commit_pages WHERE url NOT IN "
+            "(SELECT url FROM commit_pages ORDER BY fetched_at DESC LIMIT ?)",
+            (PAGE_CACHE_MAX_ROWS,)
+        )
+
+def page_cache_available():
+    """Prepare the page cache for a fetch; False means requests go out unconditionally"""
+    try:
+        init_page_cache()
+        prune_page_cache()
+        return True
+    except sqlite3.Error:
+        return False
+
+def load_cached_page(url):
+    """Return the cached (etag, last_modified, link, body) row for a URL, if any"""
+    with closing(open_page_cache()) as conn:
+        return conn.execute(
+            "SELECT etag, last_modified, link, body FROM commit_pages WHERE url = ?", (url,)
+        ).fetchone()
+
+def store_cached_page(url, response, data, fields):
+    """Remember the given fields of a list response so the next request can be conditional"""
+    etag = response.headers.get('ETag')
+    last_modified = response.headers.get('Last-Modified')
+    if not etag and not last_modified:
+        return
+    body = orjson.dumps([{field: item[field] for field in fields if field in item} for item in data])
+    with closing(open_page_cache()) as conn, conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO commit_pages VALUES (?, ?, ?, ?, ?, ?)",
+            (url, etag, last_modified, response.headers.get('Link', ''), body, time.time())
+        )
+
+def make_api_request(url, headers, params=None, timeout=30, cache_fields=None):
+    """Make API request with error handling, also returning the response headers.
+
+    With cache_fields, a list response is cached (those fields only) and revalidated
+    on the next request; the cache is best effort and never fails the request.
+    """
     try:
-        response = requests.get(url, headers=headers, params=params, timeout=timeout)
+        cached = None
+        if cache_fields:
+            # Revalidate the stored copy; an unchanged page comes back as a bodiless 304
+            url = requests.Request('GET', url, params=params).prepare().url
+            params = None
+            try:
+                cached = load_cached_page(url)
+            except sqlite3.Error:
+                cached = None
+            if cached:
+                etag, last_modified, _, _ = cached
+                headers = dict(headers)
+                if etag:
+                    headers['If-None-Match'] = etag
+                if last_modified:
+                    headers['If-Modified-Since'] = last_modified
+        wait_for_rate_limit()
+        response = HTTP_SESSION.get(url, headers=headers, params=params, timeout=timeout)
+        if response.status_code == 304 and cached:
+            _, _, link, body = cached
+            return orjson.loads(body), {'Link': link}, None
         if response.status_code == 200:
-            return response.json(), None
+            data = orjson.loads(response.content)
+            if cache_fields:
+                try:
+                    store_cached_page(url, response, data, cache_fields)
+                except sqlite3.Error:
+                    pass
+            return data, response.headers, None
         else:
             error_msg = f"HTTP {response.status_code}"
             try:
-                error_data = response.json()
+                error_data = orjson.loads(response.content)
                 error_msg += f": {error_data}"
             except:
                 error_msg += f": {response.text[:200]}"
-            return None, error_msg
-    except requests.exceptions.RequestException as e:
-        return None, f"Request failed: {str(e)}"
+            return None, response.headers, error_msg
+    except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
+        return None, {}, f"Request failed: {str(e)}"
 
+def next_page_url(response_headers):
+    """Return the rel="next" URL from a GitLab Link header, or None on the last page"""
+    for link in requests.utils.parse_header_links(response_headers.get('Link', '')):
+        if link.get('rel') == 'next':
+            return link['url']
+    return None
+
+def fetch_project_commits(base_url, project, headers, since_date=None, cache_fields=None):
+    """Fetch all commit pages of a single project as author/date/title columns"""
+    project_name = project['path_with_namespace']
+    url = f"{base_url}/projects/{project['id']}/repository/commits"
+    params = {'per_page': 100}
+    if since_date:
+        params['since'] = since_date.isoformat()
+    columns = {'author': [], 'created_at': [], 'title': []}
+    while url:
+        data, response_headers, err = make_api_request(url, headers, params, cache_fields=cache_fields)
+        if err:
+            return project_name, columns, f"Error fetching commits for project {project_name}: {err}"
+        if not data:
+            break
+        for commit in data:
+            columns['author'].append(commit.get('author_name', 'Unknown'))
+            columns['created_at'].append(commit.get('created_at', ''))
+            columns['title'].append(commit.get('title', commit.get('message', '')))
+        # The next link already carries every query parameter
+        url, params = next_page_url(response_headers), None
+    return project_name, columns, None
+
+class FetchError(Exception):
+    """Failed or partial fetch; raising it keeps the result out of the st.cache_data cache"""
+    def __init__(self, errors, commits):
+        super().__init__("; ".join(errors))
+        self.errors = errors
+        self.commits = commits
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
 def fetch_all_commits(group_id_or_path, token, since_date=None, max_projects=20):
-    """Fetch commits from all projects in the group"""
+    """Fetch commits from all projects in the group as a DataFrame (FetchError on any failure)"""
     headers = {"PRIVATE-TOKEN": token}
     
-    # Get projects in group (pagination handling)
+    # Get projects in group (keyset pagination handling)
     projects = []
-    page = 1
-    per_page = 50
     base_url = "https://code.swecha.org/api/v4"
-    while True:
-        params = {'page': page, 'per_page': per_page}
-        url = f"{base_url}/groups/{group_id_or_path}/projects"
-        data, err = make_api_request(url, headers, params)
+    url = f"{base_url}/groups/{group_id_or_path}/projects"
+    # Ask for no more projects than will be analyzed, so one request usually suffices
+    per_page = min(100, max_projects)
+    params = {'pagination': 'keyset', 'order_by': 'id', 'sort': 'asc', 'per_page': per_page}
+    while url:
+        data, response_headers, err = make_api_request(url, headers, params)
         if err:
-            st.error(f"Error fetching projects: {err}")
-            return []
+            raise FetchError(
+                [f"Error fetching projects: {err}"],
+                pd.DataFrame(columns=COMMIT_COLUMNS + ['category'])
+            )
         if not data:
             break
-        projects.extend(data)
-        if len(data) < per_page or len(projects) >= max_projects:
+        projects.extend(data[:max_projects - len(projects)])
+        if len(projects) >= max_projects:
             break
-        page += 1
-
-    projects = projects[:max_projects]
-    all_commits = []
-    for project in projects:
-        project_id = project['id']
-        project_name = project['path_with_namespace']
-        page = 1
-        while True:
-            params = {'page': page, 'per_page': 100}
-            if since_date:
-                params['since'] = since_date.isoformat()
-            url = f"{base_url}/projects/{project_id}/repository/commits"
-            commits, err = make_api_request(url, headers, params)
+        url, params = next_page_url(response_headers), None
+
+    cache_fields = COMMIT_CACHE_FIELDS if page_cache_available() else None
+    columns = {name: [] for name in COMMIT_COLUMNS}
+    errors = []
+    # Projects are fetched concurrently; errors are collected and raised afterwards
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+        results = executor.map(
+            lambda project: fetch_project_commits(base_url, project, headers, since_date, cache_fields),
+            projects
+        )
+        for project_name, project_columns, err in results:
             if err:
-                st.warning(f"Error fetching commits for project {project_name}: {err}")
-                break
-            if not commits:
-                break
-            for commit in commits:
-                commit['project_name'] = project_name
-            all_commits.extend(commits)
-            if len(commits) < 100:
-                break
-            page += 1
-        time.sleep(0.2)  # To avoid hitting rate limits
-    return all_commits
+                errors.append(err)
+            columns['project'].extend([project_name] * len(project_columns['author']))
+            for name, values in project_columns.items():
+                columns[name].extend(values)
+    commits = pd.DataFrame(columns)
+    # A categorical column stores the six labels once and gives aggregations a fixed layout
+    commits['category'] = pd.Categorical(
+        commits['title'].map(categorize_commit_message), categories=CATEGORIES
+    )
+    if errors:
+        raise FetchError(errors, commits)
+    return commits
+
+# Commit categories in priority order; the first matching pattern wins
+CATEGORY_PATTERNS = [
+    ("Bug Fix", r'\bfix(es|ed)?\b'),
+    ("Feature", r'\bfeature\b|\badd(ed)?\b'),
+    ("Refactor", r'\brefactor(ed)?\b'),
+    ("Documentation", r'\bdoc(s|umentation)?\b'),
+    ("Tests", r'\btest(s|ing)?\b'),
+]
+# Every category a commit can get, in a fixed order
+CATEGORIES = tuple(category for category, _ in CATEGORY_PATTERNS) + ("Other",)
+
+@st.cache_resource(show_spinner=False)
+def build_category_database():
+    """Compile every category pattern into a single Hyperscan database, if available"""
+    if hyperscan is None:
+        return None
+    db = hyperscan.Database()
+    db.compile(
+        expressions=[pattern.encode() for _, pattern in CATEGORY_PATTERNS],
+        ids=list(range(len(CATEGORY_PATTERNS))),
+        elements=len(CATEGORY_PATTERNS),
+        flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH] * len(CATEGORY_PATTERNS),
+    )
+    return db
 
+CATEGORY_DB = build_category_database()
+# Fallback used when hyperscan is not installed: one alternation, group c<i> for pattern i
+CATEGORY_REGEX = re.compile(
+    "|".join(f"(?P<c{i}>{pattern})" for i, (_, pattern) in enumerate(CATEGORY_PATTERNS)),
+    re.IGNORECASE
+)
+# Hyperscan scratch space is not thread-safe, so each thread allocates its own once
+_scan_state = threading.local()
+
+def on_category_match(pattern_id, start, end, flags, hits):
+    """Record a matched category id for the scan in progress"""
+    hits.append(pattern_id)
+
+@lru_cache(maxsize=65536)
 def categorize_commit_message(message):
-    """Basic categorization of commit messages"""
-    message = message.lower()
-    if re.search(r'\bfix(es|ed)?\b', message):
-        return "Bug Fix"
-    elif re.search(r'\bfeature\b|\badd(ed)?\b', message):
-        return "Feature"
-    elif re.search(r'\brefactor(ed)?\b', message):
-        return "Refactor"
-    elif re.search(r'\bdoc(s|umentation)?\b', message):
-        return "Documentation"
-    elif re.search(r'\btest(s|ing)?\b', message):
-        return "Tests"
+    """Basic categorization of commit messages (memoized, titles repeat often)"""
+    # Hyperscan only knows ASCII word boundaries and case folding, so other titles use re
+    if CATEGORY_DB is not None and message.isascii():
+        scratch = getattr(_scan_state, 'scratch', None)
+        if scratch is None:
+            scratch = _scan_state.scratch = hyperscan.Scratch(CATEGORY_DB)
+        hits = []
+        CATEGORY_DB.scan(message.encode(), match_event_handler=on_category_match,
+                         context=hits, scratch=scratch)
     else:
-        return "Other"
+        # Alternation finds the leftmost match, so keep every hit to honour priority
+        hits = [int(match.lastgroup[1:]) for match in CATEGORY_REGEX.finditer(message)]
+    return CATEGORY_PATTERNS[min(hits)][0] if hits else "Other"
 
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
 def analyze_team_members(commits):
-    """Analyze commits per team member"""
+    """Analyze commits per team member, returning per-member stats and team totals"""
+    # A single author x category count matrix; its row sums are the commit totals
+    category_counts = (
+        commits.groupby(['author', 'category'], sort=False, observed=False)
+        .size().unstack(fill_value=0)
+    )
+    category_rows = category_counts.to_dict('index')
+    project_counts = commits.groupby('author', sort=False)['project'].nunique()
     team_analysis = {}
-    for commit in commits:
-        author_name = commit.get('author_name', 'Unknown')
-        if author_name not in team_analysis:
-            team_analysis[author_name] = {
-                'commits': [],
-                'stats': {
-                    'total_commits': 0,
-                    'projects': set(),
-                    'categories': defaultdict(int),
-                }
+    for member, projects in project_counts.items():
+        categories = {category: count for category, count in category_rows[member].items() if count}
+        team_analysis[member] = {
+            'stats': {
+                'total_commits': sum(categories.values()),
+                'projects': int(projects),
+                'categories': categories,
             }
-        team_analysis[author_name]['commits'].append(commit)
-        team_analysis[author_name]['stats']['total_commits'] += 1
-        team_analysis[author_name]['stats']['projects'].add(commit.get('project_name', 'Unknown'))
-        category = categorize_commit_message(commit.get('title', commit.get('message', '')))
-        team_analysis[author_name]['stats']['categories'][category] += 1
-    
-    # Convert projects sets to counts and generate summary markdown
-    for member, data in team_analysis.items():
-        data['stats']['projects'] = len(data['stats']['projects'])
-        # Compose summary markdown for member
-        total = data['stats']['total_commits']
-        projects = data['stats']['projects']
-        categories = data['stats']['categories']
-        summary_lines = [
-            f"## {member}",
-            f"- Total Commits: **{total}**",
-            f"- Projects Contributed To: **{projects}**",
-            "- Commit Categories:",
-        ]
-        for cat, count in categories.items():
-            summary_lines.append(f"  - {cat}: {count}")
-        data['summary'] = "\n".join(summary_lines)
-    return team_analysis
-
-def create_team_overview_dashboard(team_analysis):
+        }
+    # Team-wide totals come from the same matrix, so the overview never rescans commits
+    team_totals = {
+        'commits': len(commits),
+        'projects': int(commits['project'].nunique()),
+        'categories': {
+            category: int(count) for category, count in category_counts.sum().items() if count
+        },
+    }
+    return team_analysis, team_totals
+
+@st.cache_data(show_spinner=False)
+def build_member_summary(member, stats):
+    """Compose summary markdown for a member, only once they are actually viewed"""
+    summary_lines = [
+        f"## {member}",
+        f"- Total Commits: **{stats['total_commits']}**",
+        f"- Projects Contributed To: **{stats['projects']}**",
+        "- Commit Categories:",
+    ]
+    for cat, count in stats['categories'].items():
+        summary_lines.append(f"  - {cat}: {count}")
+    return "\n".join(summary_lines)
+
+def create_team_overview_dashboard(team_analysis, team_totals):
     """Create a visual dashboard for team overview"""
     if not team_analysis:
         st.warning("No team data to display")
@@ -151,12 +383,8 @@ def create_team_overview_dashboard(team_analysis):
 
     # Team statistics
     total_members = len(team_analysis)
-    total_commits = sum(member['stats']['total_commits'] for member in team_analysis.values())
-    total_projects = len(set(
-        project for member in team_analysis.values() 
-        for commit in member['commits'] 
-        for project in [commit.get('project_name', 'Unknown')]
-    ))
+    total_commits = team_totals['commits']
+    total_projects = team_totals['projects']
 
     col1, col2, col3, col4 = st.columns(4)
     with col1:
@@ -171,35 +399,71 @@ def create_team_overview_dashboard(team_analysis):
 
     # Member contribution chart
     st.subheader("📊 Member Contributions")
-    member_data = []
-    for member, data in team_analysis.items():
-        member_data.append({
-            'Member': member,
-            'Commits': data['stats']['total_commits'],
-            'Projects': data['stats']['projects']
-        })
-    df = pd.DataFrame(member_data)
+    members = list(team_analysis)
+    df = pd.DataFrame({
+        'Member': members,
+        'Commits': [team_analysis[m]['stats']['total_commits'] for m in members],
+        'Projects': [team_analysis[m]['stats']['projects'] for m in members],
+    })
     col1, col2 = st.columns(2)
+    # Plain bar charts render through Vega-Lite, much cheaper than Plotly figures
     with col1:
-        fig_commits = px.bar(df, x='Member', y='Commits', title='Commits per Member')
-        fig_commits.update_xaxes(tickangle=45)
-        st.plotly_chart(fig_commits, use_container_width=True)
+        st.markdown("**Commits per Member**")
+        st.bar_chart(df, x='Member', y='Commits', use_container_width=True)
     with col2:
-        fig_projects = px.bar(df, x='Member', y='Projects', title='Projects per Member')
-        fig_projects.update_xaxes(tickangle=45)
-        st.plotly_chart(fig_projects, use_container_width=True)
+        st.markdown("**Projects per Member**")
+        st.bar_chart(df, x='Member', y='Projects', use_container_width=True)
 
     # Category distribution across team
     st.subheader("🏷️ Work Distribution Across Team")
-    all_categories = defaultdict(int)
-    for member_data in team_analysis.values():
-        for category, count in member_data['stats']['categories'].items():
-            all_categories[category] += count
+    all_categories = team_totals['categories']
     if all_categories:
-        categories_df = pd.DataFrame(list(all_categories.items()), columns=['Category', 'Count'])
-        fig_categories = px.pie(categories_df, values='Count', names='Category', title='Team Work Distribution')
+        # Plotly is only needed for this chart, so it is imported on first render
+        import plotly.graph_objects as go
+        fig_categories = go.Figure(go.Pie(
+            labels=list(all_categories.keys()),
+            values=list(all_categories.values())
+        ))
+        fig_categories.update_layout(title='Team Work Distribution')
         st.plotly_chart(fig_categories, use_container_width=True)
 
+@st.fragment
+def create_member_analysis_section(team_analysis, commits):
+    """Show one member's summary and commits; widget changes rerun only this section"""
+    st.header("👤 Individual Team Member Analysis")
+    selected_member = st.selectbox(
+        "Select team member to analyze:",
+        options=list(team_analysis.keys()),
+        index=0
+    )
+    if selected_member:
+        member_data = team_analysis[selected_member]
+        summary = build_member_summary(selected_member, member_data['stats'])
+        # Display member summary
+        st.markdown(summary)
+        # Download individual summary
+        col1, col2 = st.columns([1, 1])
+        with col1:
+            st.download_button(
+                label=f"📄 Download {selected_member}'s Summary",
+                data=summary,
+                file_name=f"{selected_member.replace(' ', '_')}_contribution_summary_{datetime.now().strftime('%Y%m%d')}.md",
+                mime="text/markdown"
+            )
+        with col2:
+            if st.button("📊 Show Detailed Commits"):
+                st.subheader(f"📝 All Commits by {selected_member}")
+                # Member commits are only sliced out when this view is opened
+                member_commits = commits[commits['author'] == selected_member]
+                if not member_commits.empty:
+                    df = pd.DataFrame({
+                        'Date': member_commits['created_at'].str[:10],
+                        'Project': member_commits['project'],
+                        'Message': member_commits['title'],
+                        'Category': member_commits['category'],
+                    })
+                    st.dataframe(df, use_container_width=True)
+
 # Main Streamlit App
 st.title("👥 GitLab Team Member Contribution Analyzer")
 st.markdown("**Analyze individual team member contributions with detailed insights and summaries**")
@@ -226,32 +490,55 @@ if use_date_filter:
     since_date = st.sidebar.date_input("Since date", value=datetime.now() - timedelta(days=90))
 max_projects = st.sidebar.number_input("Max projects to analyze", min_value=1, max_value=100, value=20)
 
+# Cached results are reused for CACHE_TTL seconds unless cleared here
+if st.sidebar.button(
+    "🔄 Refresh Cached Data",
+    use_container_width=True,
+    help=(
+        f"Results are reused for {CACHE_TTL // 60} minutes. Commit pages (author names, dates and "
+        f"titles only) are also kept for up to {PAGE_CACHE_MAX_AGE // 86400} days in {PAGE_CACHE_PATH}, "
+        "and are revalidated with GitLab on every fetch; delete that file to discard them."
+    )
+):
+    fetch_all_commits.clear()
+    analyze_team_members.clear()
+    st.sidebar.success("Cache cleared, the next analysis will refetch from GitLab")
+
 # Analysis button
 if st.sidebar.button("🚀 Analyze Team", type="primary", use_container_width=True):
     if not group_id or not token:
         st.error("❌ Please provide both Group ID and Access Token")
     else:
         # Clear previous data
-        st.session_state.commits_data = []
+        st.session_state.commits_data = None
         st.session_state.team_analysis = {}
+        st.session_state.team_totals = {}
         # Test authentication
         headers = {"PRIVATE-TOKEN": token}
         test_url = "https://code.swecha.org/api/v4/user"
-        test_data, test_error = make_api_request(test_url, headers)
+        test_data, _, test_error = make_api_request(test_url, headers)
         if not test_data:
             st.error("❌ Authentication failed! Please check your token.")
             st.stop()
         st.success("✅ Authentication successful!")
         # Fetch commits
         st.info("🔄 Fetching commits from all team projects...")
-        commits = fetch_all_commits(group_id, token, since_date, max_projects)
-        if commits:
+        try:
+            commits = fetch_all_commits(group_id, token, since_date, max_projects)
+        except FetchError as e:
+            # Partial results are still shown, but were not cached, so the next run retries
+            show_error = st.error if e.commits.empty else st.warning
+            for error in e.errors:
+                show_error(error)
+            commits = e.commits
+        if not commits.empty:
             st.session_state.commits_data = commits
             st.success(f"🎉 Found {len(commits)} commits total")
             # Analyze team members
             st.info("🔍 Analyzing individual team member contributions...")
-            team_analysis = analyze_team_members(commits)
+            team_analysis, team_totals = analyze_team_members(commits)
             st.session_state.team_analysis = team_analysis
+            st.session_state.team_totals = team_totals
             st.success(f"✅ Analysis complete for {len(team_analysis)} team members!")
         else:
             st.error("❌ No commits found!")
@@ -260,45 +547,13 @@ if st.sidebar.button("🚀 Analyze Team", type="primary", use_container_width=Tr
 if st.session_state.team_analysis:
     st.markdown("---")
     # Team overview dashboard
-    create_team_overview_dashboard(st.session_state.team_analysis)
+    create_team_overview_dashboard(st.session_state.team_analysis, st.session_state.team_totals)
     st.markdown("---")
     # Individual member analysis
-    st.header("👤 Individual Team Member Analysis")
-    selected_member = st.selectbox(
-        "Select team member to analyze:",
-        options=list(st.session_state.team_analysis.keys()),
-        index=0
-    )
-    if selected_member:
-        member_data = st.session_state.team_analysis[selected_member]
-        # Display member summary
-        st.markdown(member_data['summary'])
-        # Download individual summary
-        col1, col2 = st.columns([1, 1])
-        with col1:
-            st.download_button(
-                label=f"📄 Download {selected_member}'s Summary",
-                data=member_data['summary'],
-                file_name=f"{selected_member.replace(' ', '_')}_contribution_summary_{datetime.now().strftime('%Y%m%d')}.md",
-                mime="text/markdown"
-            )
-        with col2:
-            if st.button("📊 Show Detailed Commits"):
-                st.subheader(f"📝 All Commits by {selected_member}")
-                commits_df = []
-                for commit in member_data['commits']:
-                    commits_df.append({
-                        'Date': commit.get('created_at', '')[:10],
-                        'Project': commit.get('project_name', 'Unknown'),
-                        'Message': commit.get('title', commit.get('message', 'No message')),
-                        'Category': categorize_commit_message(commit.get('title', commit.get('message', '')))
-                    })
-                if commits_df:
-                    df = pd.DataFrame(commits_df)
-                    st.dataframe(df, use_container_width=True)
+    create_member_analysis_section(st.session_state.team_analysis, st.session_state.commits_data)
 
 # Help section
-if not st.session_state.team_analysis and not st.session_state.commits_data:
+if not st.session_state.team_analysis and st.session_state.commits_data is None:
     st.markdown("---")
     st.info("👆 **Enter your Team/Group ID and Access Token to analyze individual team member contributions**")
     with st.expander("🆘 Setup Instructions"):